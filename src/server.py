@@ -1,12 +1,16 @@
+import os
 import sys
+import time
 import asyncio
-from pathlib import Path
-from typing import Dict, Any, List, AsyncIterator
+from typing import Dict, Any, List, AsyncIterator, Tuple, Deque, Final, Literal, Set, TypedDict
 import socket
-import json
+import re
 import logging
-from dataclasses import dataclass 
+from collections import OrderedDict, deque
+from operator import itemgetter
+from dataclasses import dataclass, field, fields
 from contextlib import asynccontextmanager
+import orjson
 from mcp.server.fastmcp import FastMCP, Context
 
 # Configure logging
@@ -15,159 +19,517 @@ logging.basicConfig(
 )
 logger = logging.getLogger("TrellisMCPServer")
 
-# Add the parent directory to the path to import the trellis_api module
-sys.path.insert(0, str(Path(__file__).parent))
-print(str(Path(__file__).parent))
+try:
+    from .trellis_api import TrellisClient, TaskStatus, Task
+except ImportError:
+    # Installed (or run as a script) as the top-level "server" module next to trellis_api
+    from trellis_api import TrellisClient, TaskStatus, Task
 
-from trellis_api import TrellisClient, TaskStatus
-
-# Global connection to Blender
-_blender_connection = None
+# Global pool of connections to Blender
+_blender_pool = None
 _blender_lock = asyncio.Lock()
 
 # Global Trellis client
 _trellis_client = None
+_trellis_lock = asyncio.Lock()
+
+
+async def get_trellis_client() -> TrellisClient:
+    """Get or create the shared Trellis client so its HTTP connection pool is reused"""
+    global _trellis_client
+
+    async with _trellis_lock:
+        if _trellis_client is None:
+            _trellis_client = TrellisClient()
+            await _trellis_client.__aenter__()
+            logger.info("Created shared Trellis client")
+        return _trellis_client
+
+
+# get_trellis_task_status results of finished tasks by task_id. Terminal results never
+# change, so they are kept until evicted in least-recently-used order.
+_terminal_status_cache: "OrderedDict[str, str]" = OrderedDict()
+_TERMINAL_STATUS_CACHE_SIZE = 4096
+# Results of pending tasks with the monotonic time they expire at; they live briefly
+# so rapid re-polls within one LLM turn skip the HTTP calls. Expired entries are
+# dropped on lookup and swept once the dict grows past its size limit.
+_pending_status_cache: Dict[str, Tuple[float, str]] = {}
+_PENDING_TASK_CACHE_TTL = 0.5
+_PENDING_STATUS_CACHE_SIZE = 256
+# Upper bound on how long a single status call waits for a pending task
+_TASK_POLL_TIMEOUT = 5.0
+_TERMINAL_TASK_STATUSES = (TaskStatus.COMPLETE, TaskStatus.ERROR)
+
+
+@dataclass(frozen=True, slots=True)
+class TaskStatusResult:
+    """Response of get_trellis_task_status; fields left as None are omitted"""
+    task_id: str
+    status: str
+    task_type: str = None
+    message: str = None
+    model_url: str = None
+    next_step: str = None
+    error: str = None
+
+    def to_json(self) -> str:
+        """Serialize to the JSON text returned to the MCP client"""
+        values = ((f.name, getattr(self, f.name)) for f in fields(self))
+        return orjson.dumps({k: v for k, v in values if v is not None}).decode("utf-8")
+
+
+# In-flight task fetches by task_id; concurrent callers for the same task share one
+# request instead of each hitting the backend
+_task_fetches: Dict[str, asyncio.Task] = {}
+
+
+async def _get_trellis_task(task_id: str) -> Task:
+    client = await get_trellis_client()
+    return await client.get_task(task_id)
+
+
+async def fetch_trellis_task(task_id: str) -> Task:
+    """Fetch a task, sharing the request with concurrent fetches of the same task"""
+    fetch = _task_fetches.get(task_id)
+    if fetch is None:
+        fetch = _task_fetches[task_id] = asyncio.create_task(_get_trellis_task(task_id))
+        fetch.add_done_callback(lambda _: _task_fetches.pop(task_id, None))
+    # Shielded so one cancelled caller does not cancel the fetch for the others
+    return await asyncio.shield(fetch)
+
+
+async def wait_for_trellis_task(task_id: str) -> Task:
+    """Fetch a task, backing off exponentially while it is still pending"""
+    deadline = time.monotonic() + _TASK_POLL_TIMEOUT
+    attempt = 0
+    task = await fetch_trellis_task(task_id)
+
+    # here it's important to reduce the number of llm credits
+    while task.status not in _TERMINAL_TASK_STATUSES:
+        delay = min(0.1 * 2**attempt, 2.0)
+        if time.monotonic() + delay > deadline:
+            break
+        await asyncio.sleep(delay)
+        attempt += 1
+        logger.info(f"Task {task_id} still {task.status.value}, retrying ({attempt})")
+        task = await fetch_trellis_task(task_id)
+
+    return task
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment, falling back to the default"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+# Maximum bytes read per recv from Blender; large scene dumps need far fewer syscalls
+_RECV_BUFFER_SIZE = _env_int("TRELLIS_MCP_RECV_BUFSIZE", 128 * 1024)
+# Commands allowed in flight on one Blender connection. The stock addon parses each
+# connection's buffer as a single JSON document, so pipelining is opt-in.
+_PIPELINE_DEPTH = _env_int("TRELLIS_MCP_PIPELINE_DEPTH", 1)
+# Kernel send/receive buffer sizes requested for the Blender socket
+_SOCKET_BUFFER_SIZE = 1 << 20
+# Idle Blender connections kept open for reuse, like an HTTP client's per-host pool
+_BLENDER_POOL_MAX_IDLE = 4
+# Unix domain socket the addon can listen on when Blender runs on the same host;
+# skips the loopback TCP stack and is tried before falling back to TCP. Opt-in only:
+# a default path in a shared directory could be bound by another local user.
+_BLENDER_SOCKET_PATH = os.environ.get("TRELLIS_MCP_BLENDER_SOCKET") or None
+
+# Bytes that can change the nesting depth or string state of a JSON document
+_JSON_STRUCTURAL = re.compile(rb'[{}\[\]"\\]')
+
+
+class JSONFrameScanner:
+    """Track JSON nesting depth across chunks to detect when a response is complete"""
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.started = False
+        self._offset = 0  # Absolute offset of the next byte to scan
+        self._escaped = -1  # Absolute offset of a byte escaped by a backslash
+        # Closing brackets that returned to the top level, and the offset of the last one
+        self.inner_closes = 0
+        self.last_inner_close = -1
+        self.end = -1  # Offset just past the top-level value once it is complete
+
+    def feed(self, chunk) -> bool:
+        """Scan the next chunk, returning True once the top-level value is closed"""
+        base = self._offset
+        self._offset += len(chunk)
+
+        for match in _JSON_STRUCTURAL.finditer(chunk):
+            pos = base + match.start()
+            if pos == self._escaped:
+                continue
+
+            char = match.group()
+            if self.in_string:
+                if char == b"\\":
+                    self._escaped = pos + 1
+                elif char == b'"':
+                    self.in_string = False
+            elif char == b'"':
+                self.in_string = True
+            elif char in b"{[":
+                self.depth += 1
+                self.started = True
+            elif char in b"}]":
+                self.depth -= 1
+                if self.depth == 1:
+                    self.inner_closes += 1
+                    self.last_inner_close = pos
+                elif self.started and self.depth == 0:
+                    self.end = pos + 1
+                    return True
+
+        return False
+
+
+# Envelope the addon writes ahead of a successful payload: {"status": "...", "result":
+_RESULT_ENVELOPE_PREFIX = re.compile(rb'\s*\{\s*"status"\s*:\s*"(\w*)"\s*,\s*"result"\s*:\s*')
+
+
+def extract_result_payload(data, scanner: JSONFrameScanner):
+    """Slice the raw result JSON out of a Blender response without decoding it.
+
+    Only the addon's usual {"status": ..., "result": {...}} layout is handled, where
+    the result is a container and the last key; anything else returns None.
+    """
+    match = _RESULT_ENVELOPE_PREFIX.match(data)
+    if match is None or match.group(1) == b"error":
+        return None
+
+    start = match.end()
+    end = scanner.last_inner_close + 1
+    # The result must be the only top-level container, followed by nothing but "}"
+    if (
+        scanner.inner_closes != 1
+        or end <= start
+        or data[start] not in b"{["
+        or data[end:].strip() != b"}"
+    ):
+        return None
+
+    return data[start:end]
+
+
+# Serialized envelopes of commands sent before, keyed by type and hashable params and
+# evicted in least-recently-used order, so one-off commands (execute_code bodies,
+# lookups of single objects) age out while repeated status queries stay cached
+_cmd_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_CMD_CACHE_SIZE = 256
+
+
+def encode_command(command_type: str, params: Dict[str, Any] = None) -> bytes:
+    """Serialize a command envelope, reusing the bytes of identical earlier commands"""
+    try:
+        # Value types are part of the key so that e.g. 1 and True don't collide
+        key = (
+            command_type,
+            tuple(sorted((k, type(v), v) for k, v in params.items())) if params else None,
+        )
+        data = _cmd_cache.get(key)
+    except TypeError:
+        # Params holding lists or dicts are unhashable; just encode them
+        return orjson.dumps({"type": command_type, "params": params or {}})
+
+    if data is None:
+        data = orjson.dumps({"type": command_type, "params": params or {}})
+        _cmd_cache[key] = data
+        if len(_cmd_cache) > _CMD_CACHE_SIZE:
+            _cmd_cache.popitem(last=False)
+    else:
+        _cmd_cache.move_to_end(key)
+    return data
+
+
+class CommandNotSentError(ConnectionError):
+    """The connection was already closed before the command was written.
+
+    Blender never saw the command, so unlike other connection errors it is safe
+    to send it again on another connection.
+    """
 
 
+class BlenderResponseProtocol(asyncio.BufferedProtocol):
+    """Receive Blender responses straight into one growable buffer.
 
-@dataclass
+    The event loop reads into the buffer returned by get_buffer, so each byte is
+    copied once from the kernel. A complete response is handed over together with
+    its buffer, and any bytes past it start a fresh buffer for the next response.
+    """
+
+    def __init__(self, connection: "BlenderConnection"):
+        self._connection = connection
+        self.transport: asyncio.Transport = None
+        self._buf = bytearray(_RECV_BUFFER_SIZE)
+        self._filled = 0  # Bytes of _buf holding received data
+        self._scanned = 0  # Bytes of _buf the scanner has already seen
+        self._scanner = JSONFrameScanner()
+        # Cleared while the transport's write buffer is over its high-water mark
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+    def connection_made(self, transport: asyncio.Transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        # Keep room for a full read, doubling the buffer as a large response grows.
+        # The buffer is replaced rather than resized in case a view of it is still alive
+        if len(self._buf) - self._filled < _RECV_BUFFER_SIZE:
+            grown = bytearray(len(self._buf) + max(len(self._buf), _RECV_BUFFER_SIZE))
+            grown[: self._filled] = memoryview(self._buf)[: self._filled]
+            self._buf = grown
+        return memoryview(self._buf)[self._filled : self._filled + _RECV_BUFFER_SIZE]
+
+    def buffer_updated(self, nbytes: int):
+        start = self._filled
+        self._filled += nbytes
+
+        # A response can only end on a closing bracket, so skip scanning
+        # until the data received so far could hold a complete document
+        end = self._filled
+        while end > start and self._buf[end - 1] in b" \t\r\n":
+            end -= 1
+        if end == start or self._buf[end - 1] not in b"}]":
+            return
+
+        # The loop still holds a view of _buf here, so completed buffers are
+        # handed over whole and replaced instead of being trimmed in place
+        while self._scanner.feed(memoryview(self._buf)[self._scanned : self._filled]):
+            response_data, scanner = self._buf, self._scanner
+            # Any bytes left over belong to the next response
+            leftover = self._filled - scanner.end
+            self._buf = bytearray(max(leftover, _RECV_BUFFER_SIZE))
+            self._buf[:leftover] = memoryview(response_data)[scanner.end : self._filled]
+            self._filled = leftover
+            self._scanned = 0
+            self._scanner = JSONFrameScanner()
+            self._connection._response_received(response_data, scanner)
+        self._scanned = self._filled
+
+    def pause_writing(self):
+        self._writable.clear()
+
+    def resume_writing(self):
+        self._writable.set()
+
+    async def drain(self):
+        """Wait until the transport accepts more outgoing data"""
+        await self._writable.wait()
+
+    def connection_lost(self, exc: Exception):
+        self._writable.set()
+        self._connection._connection_lost(self.transport, exc)
+
+
+# Compared by identity so the pool can keep connections in a set
+@dataclass(eq=False)
 class BlenderConnection:
     host: str
     port: int
     sock: socket.socket = (
         None  # Changed from 'socket' to 'sock' to avoid naming conflict
     )
+    # Bounds connecting, sending and each response; matches the addon's timeout
+    timeout: float = 15.0
+    socket_path: str = None
+    transport: asyncio.Transport = field(default=None, repr=False)
+    _protocol: BlenderResponseProtocol = field(default=None, repr=False)
+    # Futures of in-flight commands; responses arrive in the order commands were sent
+    _pending: Deque[asyncio.Future] = field(default_factory=deque, repr=False)
+    # Bounds the number of in-flight commands on this connection
+    _pipeline: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(_PIPELINE_DEPTH), repr=False
+    )
+    # Keeps concurrent reconnects from opening several sockets
+    _connect_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
 
-    def connect(self) -> bool:
+    async def connect(self) -> bool:
         """Connect to the Blender addon socket server"""
-        if self.sock:
-            return True
+        async with self._connect_lock:
+            if self.sock:
+                return True
+
+            try:
+                if not await self._connect_unix():
+                    self.sock = self._new_socket(socket.AF_INET)
+                    # Commands are small request/response messages, so disable Nagle's delay
+                    self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                    await asyncio.wait_for(
+                        asyncio.get_running_loop().sock_connect(
+                            self.sock, (self.host, self.port)
+                        ),
+                        self.timeout,
+                    )
+                    logger.info(f"Connected to Blender at {self.host}:{self.port}")
+                loop = asyncio.get_running_loop()
+                # uvloop only accepts Unix sockets through create_unix_connection
+                if self.sock.family == getattr(socket, "AF_UNIX", None):
+                    open_transport = loop.create_unix_connection
+                else:
+                    open_transport = loop.create_connection
+                self.transport, self._protocol = await open_transport(
+                    lambda: BlenderResponseProtocol(self), sock=self.sock
+                )
+                return True
+            except Exception as e:
+                logger.error(f"Failed to connect to Blender: {str(e)}")
+                self.sock = None
+                return False
+
+    @staticmethod
+    def _new_socket(family: int) -> socket.socket:
+        """Create a non-blocking stream socket with enlarged kernel buffers"""
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+        # Non-blocking so all socket I/O goes through the event loop
+        sock.setblocking(False)
+        return sock
+
+    async def _connect_unix(self) -> bool:
+        """Try the addon's Unix domain socket; False means fall back to TCP"""
+        if (
+            not self.socket_path
+            or not hasattr(socket, "AF_UNIX")
+            or not os.path.exists(self.socket_path)
+        ):
+            return False
 
+        sock = self._new_socket(socket.AF_UNIX)
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Blender at {self.host}:{self.port}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to Blender: {str(e)}")
-            self.sock = None
+            await asyncio.wait_for(
+                asyncio.get_running_loop().sock_connect(sock, self.socket_path),
+                self.timeout,
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.info(f"Blender socket {self.socket_path} unavailable, using TCP: {str(e)}")
+            sock.close()
             return False
 
+        self.sock = sock
+        logger.info(f"Connected to Blender at {self.socket_path}")
+        return True
+
     def disconnect(self):
         """Disconnect from the Blender addon"""
+        self._fail_pending(ConnectionError("Disconnected from Blender"))
+
         if self.sock:
             try:
-                self.sock.close()
+                if self.transport:
+                    self.transport.close()
+                else:
+                    self.sock.close()
             except Exception as e:
                 logger.error(f"Error disconnecting from Blender: {str(e)}")
             finally:
                 self.sock = None
-
-    def receive_full_response(self, sock, buffer_size=8192):
-        """Receive the complete response, potentially in multiple chunks"""
-        chunks = []
-        # Use a consistent timeout value that matches the addon's timeout
-        sock.settimeout(15.0)  # Match the addon's timeout
-
-        try:
-            while True:
-                try:
-                    chunk = sock.recv(buffer_size)
-                    if not chunk:
-                        # If we get an empty chunk, the connection might be closed
-                        if (
-                            not chunks
-                        ):  # If we haven't received anything yet, this is an error
-                            raise Exception(
-                                "Connection closed before receiving any data"
-                            )
-                        break
-
-                    chunks.append(chunk)
-
-                    # Check if we've received a complete JSON object
-                    try:
-                        data = b"".join(chunks)
-                        json.loads(data.decode("utf-8"))
-                        # If we get here, it parsed successfully
-                        logger.info(f"Received complete response ({len(data)} bytes)")
-                        return data
-                    except json.JSONDecodeError:
-                        # Incomplete JSON, continue receiving
-                        continue
-                except socket.timeout:
-                    # If we hit a timeout during receiving, break the loop and try to use what we have
-                    logger.warning("Socket timeout during chunked receive")
-                    break
-                except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-                    logger.error(f"Socket connection error during receive: {str(e)}")
-                    raise  # Re-raise to be handled by the caller
-        except socket.timeout:
-            logger.warning("Socket timeout during chunked receive")
-        except Exception as e:
-            logger.error(f"Error during receive: {str(e)}")
-            raise
-
-        # If we get here, we either timed out or broke out of the loop
-        # Try to use what we have
-        if chunks:
-            data = b"".join(chunks)
-            logger.info(f"Returning data after receive completion ({len(data)} bytes)")
-            try:
-                # Try to parse what we have
-                json.loads(data.decode("utf-8"))
-                return data
-            except json.JSONDecodeError:
-                # If we can't parse it, it's incomplete
-                raise Exception("Incomplete JSON response received")
+                self.transport = self._protocol = None
+
+    def _fail_pending(self, error: Exception):
+        """Fail every in-flight command, e.g. once the connection is gone"""
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    def _response_received(self, response_data: bytearray, scanner: JSONFrameScanner):
+        """Hand a complete response to the oldest in-flight command"""
+        logger.info(f"Received complete response ({scanner.end} bytes)")
+        if self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_result((response_data, scanner))
         else:
-            raise Exception("No data received")
-
-    def send_command(
+            logger.warning("Dropping unsolicited response from Blender")
+
+    def _connection_lost(self, transport: asyncio.Transport, exc: Exception):
+        """Called by the protocol once the socket is closed by either side"""
+        # disconnect() already cleaned up after a transport it closed itself
+        if transport is not self.transport:
+            return
+        error = ConnectionError(str(exc) if exc else "Connection closed by Blender")
+        logger.error(f"Error during receive: {str(error)}")
+        self._fail_pending(error)
+        # Drop the socket so the next command reconnects
+        self.disconnect()
+
+    async def send_command(
         self, command_type: str, params: Dict[str, Any] = None
     ) -> Dict[str, Any]:
         """Send a command to Blender and return the response"""
-        if not self.sock and not self.connect():
+        payload = await self.send_command_raw(command_type, params)
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON result from Blender: {str(e)}")
+            raise Exception(f"Invalid response from Blender: {str(e)}")
+
+    async def send_command_raw(
+        self, command_type: str, params: Dict[str, Any] = None
+    ) -> bytes:
+        """Send a command to Blender and return the undecoded JSON of its result"""
+        # Check the transport: sock is already set while another coroutine is connecting
+        if not self.transport and not await self.connect():
             raise ConnectionError("Not connected to Blender")
 
-        command = {"type": command_type, "params": params or {}}
+        command = encode_command(command_type, params)
+        # The addon may have closed the socket after the last command; writes to a
+        # closing transport are silently dropped, so fail before sending anything
+        if self.transport.is_closing():
+            self.disconnect()
+            raise CommandNotSentError("Connection to Blender was closed before sending")
 
         try:
             # Log the command being sent
             logger.info(f"Sending command: {command_type} with params: {params}")
 
-            # Send the command
-            self.sock.sendall(json.dumps(command).encode("utf-8"))
-            logger.info("Command sent, waiting for response...")
-
-            # Set a timeout for receiving - use the same timeout as in receive_full_response
-            self.sock.settimeout(15.0)  # Match the addon's timeout
-
-            # Receive the response using the improved receive_full_response method
-            response_data = self.receive_full_response(self.sock)
+            async with self._pipeline:
+                # Register the response slot and write in one step so their orders match
+                future = asyncio.get_running_loop().create_future()
+                self._pending.append(future)
+                self.transport.write(command)
+                await asyncio.wait_for(self._protocol.drain(), self.timeout)
+                logger.info("Command sent, waiting for response...")
+
+                # The protocol resolves the future with the complete response
+                response_data, scanner = await asyncio.wait_for(future, self.timeout)
+            # The protocol hands over its whole receive buffer; trim the unused tail,
+            # now that the event loop no longer holds a view of it
+            del response_data[scanner.end :]
             logger.info(f"Received {len(response_data)} bytes of data")
 
-            response = json.loads(response_data.decode("utf-8"))
-            logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
-
-            if response.get("status") == "error":
-                logger.error(f"Blender error: {response.get('message')}")
-                raise Exception(response.get("message", "Unknown error from Blender"))
+            # Fast path: hand back the result bytes without building Python objects
+            payload = extract_result_payload(response_data, scanner)
+            if payload is not None:
+                return payload
 
-            return response.get("result", {})
-        except socket.timeout:
+            response = orjson.loads(response_data)
+            logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
+        except asyncio.TimeoutError:
             logger.error("Socket timeout while waiting for response from Blender")
-            # Don't try to reconnect here - let the get_blender_connection handle reconnection
-            # Just invalidate the current socket so it will be recreated next time
-            self.sock = None
+            # A late response would be matched to the wrong command, so drop the connection
+            self.disconnect()
             raise Exception(
                 "Timeout waiting for Blender response - try simplifying your request"
             )
         except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
             logger.error(f"Socket connection error: {str(e)}")
-            self.sock = None
-            raise Exception(f"Connection to Blender lost: {str(e)}")
-        except json.JSONDecodeError as e:
+            self.disconnect()
+            raise ConnectionError(f"Connection to Blender lost: {str(e)}")
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON response from Blender: {str(e)}")
             # Try to log what was received
             if "response_data" in locals() and response_data:
@@ -175,10 +537,153 @@ class BlenderConnection:
             raise Exception(f"Invalid response from Blender: {str(e)}")
         except Exception as e:
             logger.error(f"Error communicating with Blender: {str(e)}")
-            # Don't try to reconnect here - let the get_blender_connection handle reconnection
-            self.sock = None
+            # Don't reconnect here - the pool opens a fresh connection for the next command
+            self.disconnect()
             raise Exception(f"Communication error with Blender: {str(e)}")
 
+        # Errors reported by Blender leave the connection usable for other commands
+        if response.get("status") == "error":
+            logger.error(f"Blender error: {response.get('message')}")
+            raise Exception(response.get("message", "Unknown error from Blender"))
+
+        return orjson.dumps(response.get("result", {}))
+
+    async def send_sequence(self, commands: List[Dict[str, Any]]) -> List[Any]:
+        """Send commands one at a time, in order, returning each result or exception.
+
+        Later commands see the effects of earlier ones, e.g. several edits to one object.
+        """
+        results = []
+        for cmd in commands:
+            try:
+                results.append(await self.send_command(cmd["type"], cmd.get("params")))
+            except Exception as e:
+                # Nothing has reached Blender yet, so the pool may retry the whole sequence
+                if not results and isinstance(e, CommandNotSentError):
+                    raise
+                results.append(e)
+        return results
+
+
+class BlenderConnectionPool:
+    """Keep-alive pool of Blender connections to one addon endpoint.
+
+    Connections are handed out exclusively and returned afterwards, so concurrent
+    tool calls each get their own socket instead of reconnecting per call.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        socket_path: str = None,
+        max_idle: int = _BLENDER_POOL_MAX_IDLE,
+    ):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self._idle: asyncio.Queue = asyncio.Queue(maxsize=max_idle)
+        # Every open connection, idle or checked out, so shutdown can close them all
+        self._connections: Set[BlenderConnection] = set()
+        # Whether the addon understands "batch" envelopes; None until first tried.
+        # Kept here so only the first batch probes, not every new connection.
+        self._batch_supported: bool = None
+
+    async def _checkout(self) -> Tuple[BlenderConnection, bool]:
+        """Take a live idle connection or open a new one; also report whether it was reused"""
+        while not self._idle.empty():
+            connection = self._idle.get_nowait()
+            # The protocol drops the transport if the addon closed the socket
+            if connection.transport is not None:
+                return connection, True
+            self._connections.discard(connection)
+
+        connection = BlenderConnection(
+            host=self.host, port=self.port, socket_path=self.socket_path
+        )
+        if not await connection.connect():
+            raise ConnectionError(
+                "Could not connect to Blender. Make sure the Blender addon is running."
+            )
+        self._connections.add(connection)
+        logger.info("Created new pooled connection to Blender")
+        return connection, False
+
+    def _checkin(self, connection: BlenderConnection):
+        """Return a connection to the idle pool, closing it if it is dead or the pool is full"""
+        if connection.transport is None:
+            self._connections.discard(connection)
+            return
+        try:
+            self._idle.put_nowait(connection)
+        except asyncio.QueueFull:
+            connection.disconnect()
+            self._connections.discard(connection)
+
+    async def _run(self, method: str, *args) -> Any:
+        """Call a BlenderConnection method on a pooled connection, retrying once on a stale one"""
+        connection, reused = await self._checkout()
+        try:
+            return await getattr(connection, method)(*args)
+        except CommandNotSentError:
+            # The addon closed the idle socket before the command went out, so it is
+            # safe to retry once on a fresh connection. Any failure after the write
+            # is raised as-is: Blender may already have run the command.
+            if not reused:
+                raise
+            logger.warning("Pooled Blender connection was stale, reconnecting")
+            # Check the dead connection in first so the pool stops tracking it
+            self._checkin(connection)
+            connection, _ = await self._checkout()
+            return await getattr(connection, method)(*args)
+        finally:
+            self._checkin(connection)
+
+    async def send_command(
+        self, command_type: str, params: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Send a command to Blender over a pooled connection and return the response"""
+        return await self._run("send_command", command_type, params)
+
+    async def send_command_raw(
+        self, command_type: str, params: Dict[str, Any] = None
+    ) -> bytes:
+        """Send a command over a pooled connection and return the undecoded JSON result"""
+        return await self._run("send_command_raw", command_type, params)
+
+    async def send_batch(self, commands: List[Dict[str, Any]]) -> List[Any]:
+        """Send several commands in one round trip and return their results in order.
+
+        Each command is a {"type": ..., "params": ...} dict. A command that fails
+        yields its exception in place of a result, like gather(return_exceptions=True).
+        """
+        if self._batch_supported is not False:
+            try:
+                result = await self.send_command("batch", {"commands": commands})
+                self._batch_supported = True
+                return [
+                    item.get("result", {})
+                    if item.get("status") != "error"
+                    else Exception(item.get("message", "Unknown error from Blender"))
+                    for item in result["results"]
+                ]
+            except Exception as e:
+                if "Unknown command type" not in str(e):
+                    raise
+                logger.info("Blender addon does not support batches, sending commands one by one")
+                self._batch_supported = False
+
+        # Older addons: fall back to individual commands, sent in order over one connection
+        return await self._run("send_sequence", commands)
+
+    def disconnect(self):
+        """Close every connection, including those still checked out"""
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for connection in self._connections:
+            connection.disconnect()
+        self._connections.clear()
+
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
@@ -193,7 +698,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         # Try to connect to Blender on startup to verify it's available
         try:
             # This will initialize the global connection if needed
-            blender = get_blender_connection()
+            blender = await get_blender_connection()
             logger.info("Successfully connected to Blender on startup")
         except Exception as e:
             logger.warning(f"Could not connect to Blender on startup: {str(e)}")
@@ -201,15 +706,22 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
                 "Make sure the Blender addon is running before using Blender resources or tools"
             )
 
+        # Open the shared Trellis client once so every tool call reuses its session
+        await get_trellis_client()
+
         # Return an empty context - we're using the global connection
         yield {}
     finally:
         # Clean up the global connection on shutdown
-        global _blender_connection
-        if _blender_connection:
+        global _blender_pool, _trellis_client
+        if _blender_pool:
             logger.info("Disconnecting from Blender on shutdown")
-            _blender_connection.disconnect()
-            _blender_connection = None
+            _blender_pool.disconnect()
+            _blender_pool = None
+        if _trellis_client:
+            logger.info("Closing Trellis client on shutdown")
+            await _trellis_client.__aexit__(None, None, None)
+            _trellis_client = None
         logger.info("BlenderMCP server shut down")
 
 
@@ -220,43 +732,47 @@ mcp = FastMCP(
     lifespan=server_lifespan,
 )
 
-_blender_connection = None
 _polyhaven_enabled = False  # Add this global variable
+# Monotonic time of the last get_polyhaven_status ping; re-pinged once the TTL expires
+_polyhaven_checked_at = 0.0
+_POLYHAVEN_STATUS_TTL = 30.0
+
+
+def _record_polyhaven_status(result: Dict[str, Any]) -> bool:
+    """Store a fresh get_polyhaven_status result and restart its TTL"""
+    global _polyhaven_enabled, _polyhaven_checked_at
+    _polyhaven_enabled = result.get("enabled", False)
+    _polyhaven_checked_at = time.monotonic()
+    return _polyhaven_enabled
+
+async def get_blender_connection() -> BlenderConnectionPool:
+    """Get the shared pool of persistent Blender connections"""
+    global _blender_pool
+
+    # Only one coroutine may create the pool or refresh the PolyHaven status at a time
+    async with _blender_lock:
+        if _blender_pool is None:
+            _blender_pool = BlenderConnectionPool(
+                host="localhost", port=9876, socket_path=_BLENDER_SOCKET_PATH
+            )
 
-def get_blender_connection():
-    """Get or create a persistent Blender connection"""
-    global _blender_connection, _polyhaven_enabled  # Add _polyhaven_enabled to globals
-
-    # If we have an existing connection, check if it's still valid
-    if _blender_connection is not None:
-        try:
-            # First check if PolyHaven is enabled by sending a ping command
-            result = _blender_connection.send_command("get_polyhaven_status")
-            # Store the PolyHaven status globally
-            _polyhaven_enabled = result.get("enabled", False)
-
-            return _blender_connection
-        except Exception as e:
-            # Connection is dead, close it and create a new one
-            logger.warning(f"Existing connection is no longer valid: {str(e)}")
+        # The PolyHaven status ping doubles as a health check; between pings, pooled
+        # sockets are trusted and dead ones are replaced when a command fails on them
+        if time.monotonic() - _polyhaven_checked_at >= _POLYHAVEN_STATUS_TTL:
             try:
-                _blender_connection.disconnect()
-            except:
-                pass
-            _blender_connection = None
-
-    # Create a new connection if needed
-    if _blender_connection is None:
-        _blender_connection = BlenderConnection(host="localhost", port=9876)
-        if not _blender_connection.connect():
-            logger.error("Failed to connect to Blender")
-            _blender_connection = None
-            raise Exception(
-                "Could not connect to Blender. Make sure the Blender addon is running."
-            )
-        logger.info("Created new persistent connection to Blender")
+                result = await _blender_pool.send_command("get_polyhaven_status")
+            except ConnectionError as e:
+                logger.error(f"Failed to connect to Blender: {str(e)}")
+                raise Exception(
+                    "Could not connect to Blender. Make sure the Blender addon is running."
+                )
+            except Exception as e:
+                logger.warning(f"Could not check PolyHaven status: {str(e)}")
+                result = {}
+            # Store the PolyHaven status globally
+            _record_polyhaven_status(result)
 
-    return _blender_connection
+        return _blender_pool
 
 
 @mcp.tool("get_scene_info")
@@ -267,11 +783,11 @@ async def get_scene_info(ctx: Context) -> Dict[str, Any]:
     Returns information about the scene, including objects, materials, and other properties.
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_scene_info")
+        blender = await get_blender_connection()
+        result = await blender.send_command_raw("get_scene_info")
 
-        # Just return the JSON representation of what Blender sent us
-        return json.dumps(result, indent=2)
+        # Just return the JSON Blender sent us, without decoding and re-encoding it
+        return result.decode("utf-8")
     except Exception as e:
         logger.error(f"Error getting scene info: {e}")
         return {"error": str(e)}
@@ -286,11 +802,13 @@ async def get_object_info(ctx: Context, object_name: str) -> Dict[str, Any]:
     - object_name: The name of the object to get information about
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_object_info", {"name": object_name})
+        blender = await get_blender_connection()
+        result = await blender.send_command_raw(
+            "get_object_info", {"name": object_name}
+        )
 
-        # Just return the JSON representation of what Blender sent us
-        return json.dumps(result, indent=2)
+        # Just return the JSON Blender sent us, without decoding and re-encoding it
+        return result.decode("utf-8")
     except Exception as e:
         logger.error(f"Error getting object info: {e}")
         return {"error": str(e)}
@@ -317,7 +835,7 @@ async def create_object(
     """
     try:
         # Get the global connection
-        blender = get_blender_connection()
+        blender = await get_blender_connection()
 
         # Set default values for missing parameters
         loc = location or [0, 0, 0]
@@ -329,7 +847,7 @@ async def create_object(
         if name:
             params["name"] = name
 
-        result = blender.send_command("create_object", params)
+        result = await blender.send_command("create_object", params)
         return f"Created {type} object: {result['name']}"
     except Exception as e:
         logger.error(f"Error creating object: {e}")
@@ -357,26 +875,70 @@ async def modify_object(
     """
     try:
         # Get the global connection
-        blender = get_blender_connection()
-
-        params = {"name": name}
-
-        if location is not None:
-            params["location"] = location
-        if rotation is not None:
-            params["rotation"] = rotation
-        if scale is not None:
-            params["scale"] = scale
-        if visible is not None:
-            params["visible"] = visible
+        blender = await get_blender_connection()
+
+        # Only send the properties that were actually given
+        params = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("location", location),
+                ("rotation", rotation),
+                ("scale", scale),
+                ("visible", visible),
+            )
+            if value is not None
+        }
 
-        result = blender.send_command("modify_object", params)
+        result = await blender.send_command("modify_object", params)
         return f"Modified object: {result['name']}"
     except Exception as e:
         logger.error(f"Error modifying object: {e}")
         return {"error": str(e)}
 
 
+@mcp.tool("modify_objects_bulk")
+async def modify_objects_bulk(
+    ctx: Context, modifications: List[Dict[str, Any]]
+) -> str:
+    """
+    Modify several existing objects in the Blender scene in a single round trip.
+
+    Parameters:
+    - modifications: List of modifications, each a dict with the object's "name" and any of
+      "location", "rotation", "scale" ([x, y, z] lists) and "visible" (boolean),
+      exactly as accepted by modify_object
+    """
+    try:
+        # Get the global connection
+        blender = await get_blender_connection()
+
+        commands = [
+            {
+                "type": "modify_object",
+                "params": {
+                    key: modification[key]
+                    for key in ("name", "location", "rotation", "scale", "visible")
+                    if modification.get(key) is not None
+                },
+            }
+            for modification in modifications
+        ]
+        results = await blender.send_batch(commands)
+
+        output = []
+        for command, result in zip(commands, results):
+            name = command["params"].get("name")
+            if isinstance(result, Exception):
+                output.append(f"Error modifying object {name}: {str(result)}")
+            else:
+                output.append(f"Modified object: {result.get('name', name)}")
+        return "\n".join(output)
+    except Exception as e:
+        logger.error(f"Error modifying objects: {e}")
+        return f"Error modifying objects: {str(e)}"
+
+
 @mcp.tool("delete_object")
 async def delete_object(ctx: Context, name: str) -> Dict[str, Any]:
     """
@@ -387,9 +949,9 @@ async def delete_object(ctx: Context, name: str) -> Dict[str, Any]:
     """
     try:
         # Get the global connection
-        blender = get_blender_connection()
+        blender = await get_blender_connection()
 
-        result = blender.send_command("delete_object", {"name": name})
+        result = await blender.send_command("delete_object", {"name": name})
         return f"Deleted object: {name}"
     except Exception as e:
         logger.error(f"Error deleting object: {e}")
@@ -397,7 +959,7 @@ async def delete_object(ctx: Context, name: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def set_material(
+async def set_material(
     ctx: Context, object_name: str, material_name: str = None, color: List[float] = None
 ) -> str:
     """
@@ -410,7 +972,7 @@ def set_material(
     """
     try:
         # Get the global connection
-        blender = get_blender_connection()
+        blender = await get_blender_connection()
 
         params = {"object_name": object_name}
 
@@ -419,7 +981,7 @@ def set_material(
         if color:
             params["color"] = color
 
-        result = blender.send_command("set_material", params)
+        result = await blender.send_command("set_material", params)
         return f"Applied material to {object_name}: {result.get('material_name', 'unknown')}"
     except Exception as e:
         logger.error(f"Error setting material: {str(e)}")
@@ -427,7 +989,7 @@ def set_material(
 
 
 @mcp.tool()
-def execute_blender_code(ctx: Context, code: str) -> str:
+async def execute_blender_code(ctx: Context, code: str) -> str:
     """
     Execute arbitrary Python code in Blender.
 
@@ -436,16 +998,16 @@ def execute_blender_code(ctx: Context, code: str) -> str:
     """
     try:
         # Get the global connection
-        blender = get_blender_connection()
+        blender = await get_blender_connection()
 
-        result = blender.send_command("execute_code", {"code": code})
+        result = await blender.send_command("execute_code", {"code": code})
         return f"Code executed successfully: {result.get('result', '')}"
     except Exception as e:
         logger.error(f"Error executing code: {str(e)}")
         return f"Error executing code: {str(e)}"
 
 @mcp.tool()
-def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
+async def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
     """
     Get a list of categories for a specific asset type on Polyhaven.
 
@@ -453,10 +1015,13 @@ def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
     - asset_type: The type of asset to get categories for (hdris, textures, models, all)
     """
     try:
-        blender = get_blender_connection()
-        if not _polyhaven_enabled:
+        blender = await get_blender_connection()
+        # The cached status may predate the user enabling PolyHaven, so confirm first
+        if not _polyhaven_enabled and not _record_polyhaven_status(
+            await blender.send_command("get_polyhaven_status")
+        ):
             return "PolyHaven integration is disabled. Select it in the sidebar in BlenderMCP, then run it again."
-        result = blender.send_command(
+        result = await blender.send_command(
             "get_polyhaven_categories", {"asset_type": asset_type}
         )
 
@@ -465,22 +1030,24 @@ def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
 
         # Format the categories in a more readable way
         categories = result["categories"]
-        formatted_output = f"Categories for {asset_type}:\n\n"
+        parts: List[str] = [f"Categories for {asset_type}:\n\n"]
 
         # Sort categories by count (descending)
-        sorted_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)
-
-        for category, count in sorted_categories:
-            formatted_output += f"- {category}: {count} assets\n"
+        parts.extend(
+            f"- {category}: {count} assets\n"
+            for category, count in sorted(
+                categories.items(), key=itemgetter(1), reverse=True
+            )
+        )
 
-        return formatted_output
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error getting Polyhaven categories: {str(e)}")
         return f"Error getting Polyhaven categories: {str(e)}"
 
 
 @mcp.tool()
-def search_polyhaven_assets(
+async def search_polyhaven_assets(
     ctx: Context, asset_type: str = "all", categories: str = None
 ) -> str:
     """
@@ -493,8 +1060,8 @@ def search_polyhaven_assets(
     Returns a list of matching assets with basic information.
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command(
+        blender = await get_blender_connection()
+        result = await blender.send_command(
             "search_polyhaven_assets",
             {"asset_type": asset_type, "categories": categories},
         )
@@ -507,10 +1074,10 @@ def search_polyhaven_assets(
         total_count = result["total_count"]
         returned_count = result["returned_count"]
 
-        formatted_output = f"Found {total_count} assets"
+        parts: List[str] = [f"Found {total_count} assets"]
         if categories:
-            formatted_output += f" in categories: {categories}"
-        formatted_output += f"\nShowing {returned_count} assets:\n\n"
+            parts.append(f" in categories: {categories}")
+        parts.append(f"\nShowing {returned_count} assets:\n\n")
 
         # Sort assets by download count (popularity)
         sorted_assets = sorted(
@@ -518,27 +1085,25 @@ def search_polyhaven_assets(
         )
 
         for asset_id, asset_data in sorted_assets:
-            formatted_output += (
-                f"- {asset_data.get('name', asset_id)} (ID: {asset_id})\n"
-            )
-            formatted_output += (
+            parts.append(f"- {asset_data.get('name', asset_id)} (ID: {asset_id})\n")
+            parts.append(
                 f"  Type: {['HDRI', 'Texture', 'Model'][asset_data.get('type', 0)]}\n"
             )
-            formatted_output += (
+            parts.append(
                 f"  Categories: {', '.join(asset_data.get('categories', []))}\n"
             )
-            formatted_output += (
+            parts.append(
                 f"  Downloads: {asset_data.get('download_count', 'Unknown')}\n\n"
             )
 
-        return formatted_output
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error searching Polyhaven assets: {str(e)}")
         return f"Error searching Polyhaven assets: {str(e)}"
 
 
 @mcp.tool()
-def download_polyhaven_asset(
+async def download_polyhaven_asset(
     ctx: Context,
     asset_id: str,
     asset_type: str,
@@ -557,8 +1122,8 @@ def download_polyhaven_asset(
     Returns a message indicating success or failure.
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command(
+        blender = await get_blender_connection()
+        result = await blender.send_command(
             "download_polyhaven_asset",
             {
                 "asset_id": asset_id,
@@ -597,7 +1162,7 @@ def download_polyhaven_asset(
 
 
 @mcp.tool()
-def set_texture(ctx: Context, object_name: str, texture_id: str) -> str:
+async def set_texture(ctx: Context, object_name: str, texture_id: str) -> str:
     """
     Apply a previously downloaded Polyhaven texture to an object.
 
@@ -609,9 +1174,9 @@ def set_texture(ctx: Context, object_name: str, texture_id: str) -> str:
     """
     try:
         # Get the global connection
-        blender = get_blender_connection()
+        blender = await get_blender_connection()
 
-        result = blender.send_command(
+        result = await blender.send_command(
             "set_texture", {"object_name": object_name, "texture_id": texture_id}
         )
 
@@ -653,15 +1218,15 @@ def set_texture(ctx: Context, object_name: str, texture_id: str) -> str:
 
 
 @mcp.tool()
-def get_polyhaven_status(ctx: Context) -> str:
+async def get_polyhaven_status(ctx: Context) -> str:
     """
     Check if PolyHaven integration is enabled in Blender.
     Returns a message indicating whether PolyHaven features are available.
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_polyhaven_status")
-        enabled = result.get("enabled", False)
+        blender = await get_blender_connection()
+        result = await blender.send_command("get_polyhaven_status")
+        enabled = _record_polyhaven_status(result)
         message = result.get("message", "")
 
         return message
@@ -700,42 +1265,42 @@ async def create_3d_model_from_text_trellis(
     A dictionary containing the task ID and instructions for checking the status.
     """
     try:
-        async with TrellisClient() as client:
-            # Start the text-to-3D task
-            task_id = await client.text_to_3d(
-                prompt=prompt,
-                negative_prompt=negative_prompt,
-                geometry_sample_steps=geometry_sample_steps,
-                geometry_cfg_strength=geometry_cfg_strength,
-                texture_sample_steps=texture_sample_steps,
-                texture_cfg_strength=texture_cfg_strength
-            )
-            
-            if not task_id:
-                return {
-                    "error": "Failed to start text-to-3D task. No task ID returned."
-                }
-            
+        client = await get_trellis_client()
+        # Start the text-to-3D task
+        task_id = await client.text_to_3d(
+            prompt=prompt,
+            negative_prompt=negative_prompt,
+            geometry_sample_steps=geometry_sample_steps,
+            geometry_cfg_strength=geometry_cfg_strength,
+            texture_sample_steps=texture_sample_steps,
+            texture_cfg_strength=texture_cfg_strength
+        )
+        
+        if not task_id:
             return {
-                "task_id": task_id,
-                "status": "queued", 
-                "message": "Task created successfully. The 3D model generation is in progress.",
-                "next_step": "You MUST now call get_trellis_task_status with this task_id to check progress.",
-                "important_note": "3D model generation takes tens of seconds. You need to repeatedly call get_trellis_task_status until completion.",
-                "workflow": [
-                    "1. You've completed this step by calling create_3d_model_from_text_trellis",
-                    "2. Now call get_trellis_task_status with task_id: " + task_id,
-                    "3. If status is not COMPLETE, wait and call get_trellis_task_status again",
-                    "4. When status is COMPLETE, use the model_url from the response",
-                ],
+                "error": "Failed to start text-to-3D task. No task ID returned."
             }
+        
+        return {
+            "task_id": task_id,
+            "status": "queued", 
+            "message": "Task created successfully. The 3D model generation is in progress.",
+            "next_step": "You MUST now call get_trellis_task_status with this task_id to check progress.",
+            "important_note": "3D model generation takes tens of seconds. You need to repeatedly call get_trellis_task_status until completion.",
+            "workflow": [
+                "1. You've completed this step by calling create_3d_model_from_text_trellis",
+                "2. Now call get_trellis_task_status with task_id: " + task_id,
+                "3. If status is not COMPLETE, wait and call get_trellis_task_status again",
+                "4. When status is COMPLETE, use the model_url from the response",
+            ],
+        }
 
     except Exception as e:
         logger.error(f"Error creating 3D model from text: {e}")
         return {"error": str(e)}
 
 @mcp.tool("get_trellis_task_status")
-async def get_trellis_task_status(task_id: str) -> Dict[str, Any]:
+async def get_trellis_task_status(task_id: str) -> str:
     """
     Get the status of a 3D model generation task.
 
@@ -754,110 +1319,184 @@ async def get_trellis_task_status(task_id: str) -> Dict[str, Any]:
         task_id: The ID of the task to check (obtained from create_3d_model_from_text_trellis).
 
     Returns:
-        A dictionary containing the task status and other information.
+        A JSON object containing the task status and other information.
     """
+    cached = _terminal_status_cache.get(task_id)
+    if cached is not None:
+        _terminal_status_cache.move_to_end(task_id)
+        return cached
+    pending = _pending_status_cache.get(task_id)
+    if pending is not None:
+        if time.monotonic() < pending[0]:
+            return pending[1]
+        del _pending_status_cache[task_id]
+
     try:
-        async with TrellisClient() as client:
-            # Try up to 5 times if the status is queued
-            retry_count = 0
-            max_retries = 5
-            task = await client.get_task(task_id)
-
-            # here it's important to reduce the number of llm credits 
-            while (task.status.value == "queued" or task.status.value == "processing") and retry_count < max_retries:
-                # Wait for 1 second before retrying
-                await asyncio.sleep(1)
-                retry_count += 1
-                logger.info(f"Task {task_id} still queued, retrying ({retry_count}/{max_retries})")
-                task = await client.get_task(task_id)
-            
-            result = {
-                "task_id": task.request_id,
-                "status": task.status.value,
-                "task_type": task.task_type,
-            }
+        client = await get_trellis_client()
+        task = await wait_for_trellis_task(task_id)
+
+        # Add additional information based on task status
+        if task.status == TaskStatus.COMPLETE:
+            # For completed tasks, add URLs to the output files
+            base_url = client.base_url
+            output_dir = task.request_output_dir
             
-            # Add additional information based on task status
-            if task.status == TaskStatus.COMPLETE:
-                # For completed tasks, add URLs to the output files
-                base_url = client.base_url
-                output_dir = task.request_output_dir
-                
-                if output_dir:
-                    # The output directory is relative to the server
-                    # We need to construct URLs to the output files
-                    file_url = f"{base_url}/output/{task.client_ip}/{task.request_id}/output.glb"
-                    result.update({
-                        "model_url": file_url, 
-                        "message": "Task completed successfully. You can now use the model_url.", 
-                        "next_step": "Use the model_url to access the 3D model, download it through import_trellis_glb_model tool"
-                    })
-                else:
-                    result["message"] = "Task completed but no output directory was found."
-            
-            elif task.status == TaskStatus.ERROR:
-                # For failed tasks, add the error message
-                result["error"] = task.error or "Unknown error"
-                result["message"] = f"Task failed: {task.error}"
-    
-            else:
-                # For pending tasks, add a message to check again later
-                result["message"] = (
-                    f"Task is still in progress. Current status: {task.status.value}"
+            if output_dir:
+                # The output directory is relative to the server
+                # We need to construct URLs to the output files
+                file_url = f"{base_url}/output/{task.client_ip}/{task.request_id}/output.glb"
+                status = TaskStatusResult(
+                    task_id=task.request_id,
+                    status=task.status.value,
+                    task_type=task.task_type,
+                    model_url=file_url,
+                    message="Task completed successfully. You can now use the model_url.",
+                    next_step="Use the model_url to access the 3D model, download it through import_trellis_glb_model tool",
                 )
-                result["next_step"] = (
-                    "IMPORTANT: You must call get_trellis_task_status again with this task_id to continue checking progress."
+            else:
+                status = TaskStatusResult(
+                    task_id=task.request_id,
+                    status=task.status.value,
+                    task_type=task.task_type,
+                    message="Task completed but no output directory was found.",
                 )
-            
-            return result
+        
+        elif task.status == TaskStatus.ERROR:
+            # For failed tasks, add the error message
+            status = TaskStatusResult(
+                task_id=task.request_id,
+                status=task.status.value,
+                task_type=task.task_type,
+                error=task.error or "Unknown error",
+                message=f"Task failed: {task.error}",
+            )
+    
+        else:
+            # For pending tasks, add a message to check again later
+            status = TaskStatusResult(
+                task_id=task.request_id,
+                status=task.status.value,
+                task_type=task.task_type,
+                message=f"Task is still in progress. Current status: {task.status.value}",
+                next_step="IMPORTANT: You must call get_trellis_task_status again with this task_id to continue checking progress.",
+            )
+
+        result = status.to_json()
+        if task.status in _TERMINAL_TASK_STATUSES:
+            _pending_status_cache.pop(task_id, None)
+            _terminal_status_cache[task_id] = result
+            _terminal_status_cache.move_to_end(task_id)
+            if len(_terminal_status_cache) > _TERMINAL_STATUS_CACHE_SIZE:
+                _terminal_status_cache.popitem(last=False)
+        else:
+            now = time.monotonic()
+            if len(_pending_status_cache) >= _PENDING_STATUS_CACHE_SIZE:
+                expired = [key for key, (expiry, _) in _pending_status_cache.items() if expiry <= now]
+                for key in expired:
+                    del _pending_status_cache[key]
+            _pending_status_cache[task_id] = (now + _PENDING_TASK_CACHE_TTL, result)
+        return result
     except Exception as e:
         logger.error(f"Error getting task status: {e}")
-        return {"error": str(e)}
+        return orjson.dumps({"error": str(e)}).decode("utf-8")
+
+
+class ModelInfo(TypedDict):
+    """A mesh imported by the Blender addon"""
+    name: str
+    dimensions: Dict[str, float]
+
+
+class ImportResult(TypedDict, total=False):
+    """Response of import_trellis_glb_model; message is always set"""
+    status: Literal["success", "error"]
+    message: str
+    models: List[ModelInfo]
+    error: str
+
+
+# Successful import results by model_url, evicted in least-recently-used order.
+# A generated GLB never changes, so entries need no TTL.
+_import_cache: "OrderedDict[str, ImportResult]" = OrderedDict()
+_IMPORT_CACHE_SIZE = 256
+_ALREADY_IMPORTED_NOTE = (
+    "\nThis model was already imported; duplicate the existing object with python code "
+    "instead of importing it again, or pass force_reimport=True to import a new copy."
+)
+
+# Summary line per imported model; the template is parsed once at import time
+_MODEL_LINE = "• {name} | Dimensions: {x} x {y} x {z} meters".format_map
+_model_name_and_dimensions = itemgetter("name", "dimensions")
+
+
+def _format_model_line(model: ModelInfo) -> str:
+    """Format one imported model for the import summary"""
+    name, dim = _model_name_and_dimensions(model)
+    return _MODEL_LINE({"name": name, "x": dim["x"], "y": dim["y"], "z": dim["z"]})
 
 
 @mcp.tool("import_trellis_glb_model")
-async def import_trellis_glb_model(ctx: Context, model_url: str) -> Dict[str, Any]:
+async def import_trellis_glb_model(
+    ctx: Context, model_url: str, force_reimport: bool = False
+) -> ImportResult:
     """
     Import a 3D model from a URL into the Blender scene.
     
     Parameters:
     - model_url: The URL of the model to import
+    - force_reimport: Import the model again even if this URL was already imported
     
     Returns:
-    A dictionary containing information about the imported model.
+    A dictionary with the import status, a readable message and the imported models.
     """
+    if not force_reimport:
+        cached = _import_cache.get(model_url)
+        if cached is not None:
+            _import_cache.move_to_end(model_url)
+            return {**cached, "message": cached["message"] + _ALREADY_IMPORTED_NOTE}
+
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("import_trellis_glb_model", {"url": model_url})
+        blender = await get_blender_connection()
+        result = await blender.send_command("import_trellis_glb_model", {"url": model_url})
 
         if "error" in result:
-            return f"Import failed: {result['error']}"
+            return {
+                "status": "error",
+                "message": f"Import failed: {result['error']}",
+                "error": result["error"],
+            }
 
         if result.get("status") == "success":
-            output = ["Successfully imported models:"]
-            for model in result.get("models", []):
-                dim = model["dimensions"]
-                output.append(
-                    f"• {model['name']} | Dimensions: "
-                    f"{dim['x']} x {dim['y']} x {dim['z']} meters"
-                )
-
-            if not output:
-                output.append("No models found in imported file")
+            models = result.get("models")
+            if not models:
+                return {
+                    "status": "success",
+                    "message": "No models found in imported file",
+                    "models": [],
+                }
 
-            return "\n".join(output)
+            lines = map(_format_model_line, models)
+            output: ImportResult = {
+                "status": "success",
+                "message": "\n".join(("Successfully imported models:", *lines)),
+                "models": models,
+            }
+            _import_cache[model_url] = output
+            _import_cache.move_to_end(model_url)
+            if len(_import_cache) > _IMPORT_CACHE_SIZE:
+                _import_cache.popitem(last=False)
+            return output
         else:
-            return f"Import failed: {result.get('message', 'Unknown error')}"
+            error = result.get("message", "Unknown error")
+            return {"status": "error", "message": f"Import failed: {error}", "error": error}
 
     except Exception as e:
         logger.error(f"Error importing model: {e}")
-        return {"error": str(e)}
+        return {"status": "error", "message": f"Import failed: {str(e)}", "error": str(e)}
 
 
-@mcp.prompt()
-def asset_creation_strategy() -> str:
-    """Defines the preferred strategy for creating assets in Blender"""
-    return """When creating 3D content in Blender, always start by checking if integrations are available:
+# Prompt text is built once at import time and returned as-is
+_ASSET_CREATION_STRATEGY: Final[str] = """When creating 3D content in Blender, always start by checking if integrations are available:
 
     0. Before anything, always check the scene from get_scene_info()
     1. First use the following tools to verify if the following integrations are enabled:
@@ -911,8 +1550,23 @@ def asset_creation_strategy() -> str:
     """
 
 
+@mcp.prompt()
+def asset_creation_strategy() -> str:
+    """Defines the preferred strategy for creating assets in Blender"""
+    return _ASSET_CREATION_STRATEGY
+
+
 def main():
     """Run the MCP server."""
+    # uvloop is POSIX-only; Windows keeps asyncio's default proactor loop
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("Using uvloop event loop")
+        except ImportError:
+            pass
     # Set the host and port from environment variables or use defaults
     mcp.run()
 
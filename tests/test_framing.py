@@ -0,0 +1,187 @@
+import asyncio
+
+import orjson
+import pytest
+
+import server
+from server import (
+    BlenderConnection,
+    BlenderResponseProtocol,
+    JSONFrameScanner,
+    extract_result_payload,
+)
+
+
+def scan(data: bytes, chunk_size: int) -> JSONFrameScanner:
+    """Feed data in fixed-size chunks, asserting the scanner completes on the last byte"""
+    scanner = JSONFrameScanner()
+    for start in range(0, len(data), chunk_size):
+        chunk = data[start : start + chunk_size]
+        done = scanner.feed(memoryview(chunk))
+        if start + chunk_size < len(data):
+            assert not done, f"completed early at offset {start}"
+    assert done
+    assert scanner.end == len(data)
+    return scanner
+
+
+def serve_once(responses):
+    """Start a server that answers the first command with the given raw bytes"""
+    async def handle(reader, writer):
+        await reader.read(65536)
+        for response in responses:
+            writer.write(response)
+            await writer.drain()
+        await reader.read()
+        writer.close()
+
+    return asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def send_raw(responses, command_type="get_scene_info"):
+    server = await serve_once(responses)
+    port = server.sockets[0].getsockname()[1]
+    connection = BlenderConnection(host="127.0.0.1", port=port)
+    try:
+        return await connection.send_command_raw(command_type)
+    finally:
+        connection.disconnect()
+        server.close()
+        await server.wait_closed()
+
+
+# Quotes, backslashes and brackets inside strings must not change the depth
+TRICKY = orjson.dumps(
+    {
+        "status": "success",
+        "result": {
+            "code": 'print("}") # \\"{[',
+            "path": "C:\\\\blender\\\\",
+            "quote": '\\"',
+            "nested": [{"a": "]]"}, []],
+        },
+    }
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, len(TRICKY)])
+def test_scanner_escapes_split_across_chunks(chunk_size):
+    scanner = scan(TRICKY, chunk_size)
+    assert scanner.depth == 0
+    assert not scanner.in_string
+
+
+def test_scanner_every_split_point():
+    for split in range(1, len(TRICKY)):
+        scanner = JSONFrameScanner()
+        assert not scanner.feed(memoryview(TRICKY[:split]))
+        assert scanner.feed(memoryview(TRICKY[split:]))
+        assert scanner.end == len(TRICKY)
+
+
+def test_scanner_stops_at_end_of_first_document():
+    first = b'{"status": "success", "result": {"a": "}"}}'
+    second = b'{"status": "success", "result": [1, 2]}'
+    scanner = JSONFrameScanner()
+    assert scanner.feed(memoryview(first + second))
+    assert scanner.end == len(first)
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        (b'{"status": "success", "result": {"a": 1}}', b'{"a": 1}'),
+        (b' {"status":"ok","result":[1, {"b": "]"}]} ', b'[1, {"b": "]"}]'),
+        (TRICKY, orjson.dumps(orjson.loads(TRICKY)["result"])),
+    ],
+)
+def test_extract_result_payload(response, expected):
+    scanner = scan(response.rstrip(), 5)
+    payload = extract_result_payload(response, scanner)
+    assert payload is not None
+    assert orjson.loads(payload) == orjson.loads(expected)
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        # Error envelopes are decoded so the message can be raised
+        b'{"status": "error", "result": {"a": 1}, "message": "boom"}',
+        b'{"status": "error", "message": "boom"}',
+        # Unusual key orders and layouts
+        b'{"result": {"a": 1}, "status": "success"}',
+        b'{"status": "success", "result": {"a": 1}, "extra": {"b": 2}}',
+        b'{"status": "success", "result": {"a": 1}, "extra": 2}',
+        b'{"status": "success", "extra": [1], "result": {"a": 1}}',
+        # Scalar results are not sliced
+        b'{"status": "success", "result": "done"}',
+    ],
+)
+def test_extract_result_payload_falls_back(response):
+    assert extract_result_payload(response, scan(response, 4)) is None
+
+
+def test_send_command_raw_reassembles_chunked_response():
+    response = TRICKY
+    chunks = [response[i : i + 3] for i in range(0, len(response), 3)]
+    payload = asyncio.run(send_raw(chunks))
+    assert orjson.loads(payload) == orjson.loads(response)["result"]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        b'{"result": {"a": [1, 2]}, "status": "success"}',
+        b'{"status": "success", "result": {"a": [1, 2]}, "extra": {"b": 2}}',
+    ],
+)
+def test_send_command_raw_falls_back_to_full_parse(response):
+    payload = asyncio.run(send_raw([response]))
+    assert orjson.loads(payload) == {"a": [1, 2]}
+
+
+def test_send_command_raw_raises_blender_errors():
+    response = b'{"status": "error", "message": "Object not found"}'
+    with pytest.raises(Exception, match="Object not found"):
+        asyncio.run(send_raw([response]))
+
+
+def receive(chunks):
+    """Feed chunks through a response protocol the way the event loop does"""
+    async def run():
+        connection = BlenderConnection(host="127.0.0.1", port=0)
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in range(3)]
+        connection._pending.extend(futures)
+        protocol = BlenderResponseProtocol(connection)
+
+        for chunk in chunks:
+            while chunk:
+                # The loop keeps its view of the buffer alive during buffer_updated
+                view = protocol.get_buffer(-1)
+                nbytes = min(len(view), len(chunk))
+                view[:nbytes] = chunk[:nbytes]
+                protocol.buffer_updated(nbytes)
+                chunk = chunk[nbytes:]
+        results = await asyncio.wait_for(asyncio.gather(*futures), 5)
+        return [bytes(data[: scanner.end]) for data, scanner in results]
+
+    return asyncio.run(run())
+
+
+RESPONSES = [
+    b'{"status": "success", "result": {"s": "}\\""}}',
+    b'{"status": "success", "result": [1]}',
+    b'{"status": "error", "message": "{"}',
+]
+
+
+def test_protocol_splits_back_to_back_responses():
+    # Two responses arrive in one read, the third is split across reads
+    chunks = [RESPONSES[0] + RESPONSES[1] + RESPONSES[2][:10], RESPONSES[2][10:]]
+    assert receive(chunks) == RESPONSES
+
+
+def test_protocol_grows_buffer_for_large_responses(monkeypatch):
+    monkeypatch.setattr(server, "_RECV_BUFFER_SIZE", 4)
+    assert receive([b"".join(RESPONSES)]) == RESPONSES
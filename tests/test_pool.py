@@ -0,0 +1,147 @@
+import asyncio
+
+import orjson
+import pytest
+
+from server import BlenderConnectionPool
+
+
+class FakeAddon:
+    """Minimal stand-in for the Blender addon: echoes each command's params back"""
+
+    def __init__(self, close_on=None, reject=()):
+        self.close_on = close_on
+        self.reject = reject
+        self.received = []
+        self.connections = 0
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            command = orjson.loads(data)
+            self.received.append(command)
+            if command["type"] == self.close_on:
+                break
+            if command["type"] in self.reject:
+                message = f"Unknown command type: {command['type']}"
+                writer.write(orjson.dumps({"status": "error", "message": message}))
+                await writer.drain()
+                continue
+            if command["type"] == "sleep":
+                await asyncio.sleep(command["params"]["seconds"])
+            writer.write(orjson.dumps({"status": "success", "result": command["params"]}))
+            await writer.drain()
+        writer.close()
+
+
+def run_with_addon(test, **addon_options):
+    """Run test(pool, addon) against a fake addon listening on a free port"""
+    async def run():
+        addon = FakeAddon(**addon_options)
+        server = await asyncio.start_server(addon.handle, "127.0.0.1", 0)
+        pool = BlenderConnectionPool("127.0.0.1", server.sockets[0].getsockname()[1])
+        try:
+            await test(pool, addon)
+        finally:
+            pool.disconnect()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
+
+
+def test_connections_are_reused():
+    async def test(pool, addon):
+        for i in range(3):
+            assert await pool.send_command("echo", {"i": i}) == {"i": i}
+        assert addon.connections == 1
+        assert len(pool._connections) == 1
+        assert pool._idle.qsize() == 1
+
+    run_with_addon(test)
+
+
+def test_concurrent_commands_get_their_own_connections():
+    async def test(pool, addon):
+        results = await asyncio.gather(
+            *(pool.send_command("sleep", {"seconds": 0.05, "i": i}) for i in range(6))
+        )
+        assert [result["i"] for result in results] == list(range(6))
+        assert addon.connections == 6
+        # Only max_idle connections are kept once they are checked back in
+        assert pool._idle.qsize() == 4
+        assert len(pool._connections) == 4
+
+    run_with_addon(test)
+
+
+def test_stale_connection_is_retried_and_forgotten():
+    async def test(pool, addon):
+        await pool.send_command("echo", {})
+        for i in range(5):
+            # Simulate the addon having closed the idle socket before the next command
+            pool._idle._queue[0].transport.close()
+            assert await pool.send_command("echo", {"i": i}) == {"i": i}
+
+        assert len(pool._connections) == 1
+        assert all(connection.transport is not None for connection in pool._connections)
+        assert [command["params"] for command in addon.received[1:]] == [{"i": i} for i in range(5)]
+
+    run_with_addon(test)
+
+
+def test_command_lost_after_write_is_not_retried():
+    async def test(pool, addon):
+        await pool.send_command("echo", {})
+        with pytest.raises(ConnectionError):
+            await pool.send_command("execute_code", {"code": "print(1)"})
+
+        # Blender may have run the command, so it must not be sent again
+        assert [command["type"] for command in addon.received] == ["echo", "execute_code"]
+        assert not pool._connections
+
+    run_with_addon(test, close_on="execute_code")
+
+
+def test_disconnect_closes_checked_out_connections():
+    async def test(pool, addon):
+        await pool.send_command("echo", {})
+        in_flight = asyncio.create_task(pool.send_command("sleep", {"seconds": 1}))
+        await asyncio.sleep(0.1)
+        assert pool._idle.empty()
+
+        pool.disconnect()
+        with pytest.raises(ConnectionError):
+            await in_flight
+        assert not pool._connections
+        assert pool._idle.empty()
+
+    run_with_addon(test)
+
+
+def test_batch_fallback_sends_commands_in_order_on_one_connection():
+    async def test(pool, addon):
+        commands = [
+            {"type": "modify_object", "params": {"name": "Cube", "location": [i, 0, 0]}}
+            for i in range(20)
+        ]
+        commands[3] = {"type": "fail", "params": {}}
+        results = await pool.send_batch(commands)
+
+        expected = [i for i in range(20) if i != 3]
+        assert pool._batch_supported is False
+        assert isinstance(results[3], Exception)
+        assert [result["location"][0] for result in results[:3] + results[4:]] == expected
+        # Edits to one object must reach Blender in the order they were given
+        sent = [
+            command["params"]["location"][0]
+            for command in addon.received
+            if command["type"] == "modify_object"
+        ]
+        assert sent == expected
+        assert addon.connections == 1
+
+    run_with_addon(test, reject={"batch", "fail"})